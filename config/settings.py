@@ -10,8 +10,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -23,9 +26,11 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = "django-insecure-vl1^d-hpor&1s3rixt59n&br_r_83b4)roqbpb+o+h-sia@$yu"
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = os.environ.get("DJANGO_DEBUG", "1") == "1"
 
-ALLOWED_HOSTS = []
+ALLOWED_HOSTS = [
+    host for host in os.environ.get("DJANGO_ALLOWED_HOSTS", "").split(",") if host
+]
 
 
 # Application definition
@@ -42,6 +47,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "django.middleware.gzip.GZipMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -116,9 +123,70 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/6.0/howto/static-files/
 
 STATIC_URL = "static/"
+STATIC_ROOT = BASE_DIR / "staticfiles"
+STATICFILES_DIRS = [BASE_DIR / "static"]
+
+# Хешированные и сжатые файлы статики включает config/settings_production.py:
+# манифест появляется только после collectstatic. HTML и JSON ответы сжимает
+# GZipMiddleware.
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+}
 
 LOGIN_URL = "login"
 LOGIN_REDIRECT_URL = "task_list"
 LOGOUT_REDIRECT_URL = "login"
 
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True
+
+# Кеш задаётся переменными DJANGO_CACHE_BACKEND и DJANGO_CACHE_LOCATION,
+# например django.core.cache.backends.redis.RedisCache и
+# redis://127.0.0.1:6379. По умолчанию — LocMemCache, отдельный в каждом
+# процессе.
+LOCMEM_CACHE_BACKEND = "django.core.cache.backends.locmem.LocMemCache"
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get("DJANGO_CACHE_BACKEND", LOCMEM_CACHE_BACKEND),
+        "LOCATION": os.environ.get("DJANGO_CACHE_LOCATION", ""),
+    }
+}
+
+# Хранилище сессий выбирается переменной окружения DJANGO_SESSION_MODE:
+# "db" — таблица django_session (запись при каждом входе и чтение на каждый
+# запрос), "cache" — кеш без обращений к БД, "cookie" — подписанная cookie.
+SESSION_MODES = {
+    "db": "django.contrib.sessions.backends.db",
+    "cache": "django.contrib.sessions.backends.cache",
+    "cookie": "django.contrib.sessions.backends.signed_cookies",
+}
+SESSION_MODE = os.environ.get("DJANGO_SESSION_MODE", "db")
+if SESSION_MODE not in SESSION_MODES:
+    raise ImproperlyConfigured(
+        f"Неизвестный DJANGO_SESSION_MODE={SESSION_MODE!r}, "
+        f"допустимые значения: {', '.join(SESSION_MODES)}"
+    )
+if SESSION_MODE == "cache" and CACHES["default"]["BACKEND"] == LOCMEM_CACHE_BACKEND:
+    # LocMemCache у каждого воркера свой: сессия, созданная в одном процессе,
+    # не видна в другом, и пользователя случайно выбрасывает из системы.
+    raise ImproperlyConfigured(
+        "DJANGO_SESSION_MODE=cache требует общий кеш: задайте "
+        "DJANGO_CACHE_BACKEND и DJANGO_CACHE_LOCATION"
+    )
+SESSION_ENGINE = SESSION_MODES[SESSION_MODE]
+
+# Задачи, выполненные раньше этого срока (по completed_at), переносятся
+# в архив командой `python manage.py archive_tasks`.
+TASK_ARCHIVE_AFTER_DAYS = 90
+TASK_ARCHIVE_BATCH_SIZE = 500
+
+# Счётчики фильтров в списке задач кешируются и сбрасываются при изменении
+# задач; таймаут ограничивает устаревание флага «просрочено». С LocMemCache
+# сброс виден только процессу, изменившему задачу: остальные воркеры
+# показывают старые счётчики до истечения таймаута. Для нескольких воркеров
+# нужен общий кеш (DJANGO_CACHE_BACKEND).
+TASK_FACETS_CACHE_TIMEOUT = 60
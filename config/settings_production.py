@@ -0,0 +1,34 @@
+"""
+Production settings for config project.
+
+Usage: DJANGO_SETTINGS_MODULE=config.settings_production
+
+DEBUG is off unless DJANGO_DEBUG=1 and SECRET_KEY comes from
+DJANGO_SECRET_KEY. ALLOWED_HOSTS is read from DJANGO_ALLOWED_HOSTS by the
+base settings. Templates need no extra configuration: since Django 4.1 the
+default loaders are always wrapped in the cached loader.
+"""
+
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .settings import *  # noqa: F401,F403
+
+SECRET_KEY = os.environ.get("DJANGO_SECRET_KEY", "")
+if not SECRET_KEY:
+    raise ImproperlyConfigured(
+        "config.settings_production требует переменную окружения DJANGO_SECRET_KEY"
+    )
+
+DEBUG = os.environ.get("DJANGO_DEBUG", "0") == "1"
+
+# collectstatic добавляет хеш содержимого в имена файлов и сразу сжимает
+# их в .gz и .br (если установлен Brotli); WhiteNoise отдаёт хешированные
+# файлы с заголовком Cache-Control: immutable.
+STORAGES = {
+    **STORAGES,  # noqa: F405
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
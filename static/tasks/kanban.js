@@ -0,0 +1,65 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const csrfToken = document.querySelector('.kanban-container').dataset.csrfToken;
+    const tasks = document.querySelectorAll('.kanban-task');
+    const columns = document.querySelectorAll('.kanban-tasks');
+
+    tasks.forEach(task => {
+        task.addEventListener('dragstart', function(e) {
+            e.dataTransfer.setData('text/plain', task.dataset.taskId);
+            task.classList.add('dragging');
+        });
+
+        task.addEventListener('dragend', function() {
+            task.classList.remove('dragging');
+        });
+    });
+
+    columns.forEach(column => {
+        column.addEventListener('dragover', function(e) {
+            e.preventDefault();
+            column.classList.add('drag-over');
+        });
+
+        column.addEventListener('dragleave', function() {
+            column.classList.remove('drag-over');
+        });
+
+        column.addEventListener('drop', function(e) {
+            e.preventDefault();
+            column.classList.remove('drag-over');
+
+            const taskId = e.dataTransfer.getData('text/plain');
+            const newStatus = column.dataset.status;
+            const taskElement = document.querySelector(`[data-task-id="${taskId}"]`);
+
+            if (taskElement && taskElement.parentElement !== column) {
+                column.appendChild(taskElement);
+
+                fetch(`/task/${taskId}/update-status/`, {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/x-www-form-urlencoded',
+                        'X-CSRFToken': csrfToken
+                    },
+                    body: `status=${newStatus}`
+                })
+                .then(response => response.json())
+                .then(data => {
+                    if (!data.success) {
+                        location.reload();
+                    }
+                    updateColumnCounts();
+                })
+                .catch(() => location.reload());
+            }
+        });
+    });
+
+    function updateColumnCounts() {
+        document.querySelectorAll('.kanban-column').forEach(col => {
+            const count = col.querySelectorAll('.kanban-task').length;
+            const badge = col.querySelector('.badge');
+            if (badge) badge.textContent = count;
+        });
+    }
+});
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Category, Profile, Task
+from .models import ArchivedTask, Category, Profile, RecurringTask, Task
 
 
 @admin.register(Profile)
@@ -40,3 +40,39 @@ class TaskAdmin(admin.ModelAdmin):
     filter_horizontal = ["blocked_by"]
     date_hierarchy = "created_at"
     ordering = ["-created_at"]
+
+
+@admin.register(ArchivedTask)
+class ArchivedTaskAdmin(admin.ModelAdmin):
+    list_display = [
+        "title",
+        "category",
+        "assigned_to",
+        "priority",
+        "estimated_hours",
+        "created_at",
+        "completed_at",
+        "archived_at",
+    ]
+    list_filter = ["priority", "category", "assigned_to", "archived_at"]
+    search_fields = ["title", "description"]
+    date_hierarchy = "created_at"
+    ordering = ["-created_at"]
+
+
+@admin.register(RecurringTask)
+class RecurringTaskAdmin(admin.ModelAdmin):
+    list_display = [
+        "title",
+        "category",
+        "assigned_to",
+        "priority",
+        "frequency",
+        "interval",
+        "next_due",
+        "is_active",
+    ]
+    list_filter = ["is_active", "frequency", "priority", "category", "assigned_to"]
+    search_fields = ["title", "description"]
+    list_editable = ["is_active"]
+    ordering = ["next_due"]
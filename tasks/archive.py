@@ -0,0 +1,178 @@
+import heapq
+from datetime import timedelta
+from itertools import islice
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.http import Http404
+from django.utils import timezone
+
+from .models import ArchivedTask, ArchivedTaskEdge, Task
+
+TaskEdge = Task.blocked_by.through
+
+ARCHIVED_FIELDS = [
+    "title",
+    "description",
+    "created_at",
+    "deadline",
+    "estimated_hours",
+    "priority",
+    "status",
+    "category_id",
+    "assigned_to_id",
+    "completed_at",
+]
+
+
+def archive_cutoff(days=None):
+    if days is None:
+        days = settings.TASK_ARCHIVE_AFTER_DAYS
+    return timezone.now() - timedelta(days=days)
+
+
+def archive_done_tasks(days=None, batch_size=None, max_batches=None):
+    """Переносит задачи, выполненные больше `days` дней назад, в архив.
+
+    Работает порциями по `batch_size` задач, каждая порция — отдельная
+    транзакция: прерванный запуск можно просто повторить, он продолжит
+    с первой неперенесённой задачи. Порции выбираются по pk после последней
+    перенесённой задачи, поэтому старые невыполненные задачи с малыми pk
+    просматриваются один раз за запуск. Возвращает число перенесённых задач.
+    """
+    if batch_size is None:
+        batch_size = settings.TASK_ARCHIVE_BATCH_SIZE
+    cutoff = archive_cutoff(days)
+    candidates = Task.objects.filter(
+        status="done", completed_at__lt=cutoff
+    ).order_by("pk")
+
+    moved = 0
+    batches = 0
+    last_pk = 0
+    while max_batches is None or batches < max_batches:
+        batch = candidates.filter(pk__gt=last_pk).values_list("pk", flat=True)
+        with transaction.atomic():
+            ids = list(batch[:batch_size])
+            if not ids:
+                break
+            _archive_batch(ids)
+        last_pk = ids[-1]
+        moved += len(ids)
+        batches += 1
+    return moved
+
+
+def _archive_batch(ids):
+    rows = Task.objects.filter(pk__in=ids).values("pk", *ARCHIVED_FIELDS)
+    ArchivedTask.objects.bulk_create(
+        [ArchivedTask(id=row.pop("pk"), **row) for row in rows],
+        ignore_conflicts=True,
+    )
+
+    edges = TaskEdge.objects.filter(
+        Q(from_task_id__in=ids) | Q(to_task_id__in=ids)
+    ).values_list("from_task_id", "to_task_id")
+    ArchivedTaskEdge.objects.bulk_create(
+        [
+            ArchivedTaskEdge(from_task_id=from_id, to_task_id=to_id)
+            for from_id, to_id in edges
+        ],
+        ignore_conflicts=True,
+    )
+
+    Task.objects.filter(pk__in=ids).delete()
+
+
+def get_task(pk):
+    """Ищет задачу сначала в горячей таблице, затем в архиве."""
+    related = ("category", "assigned_to")
+    task = Task.objects.select_related(*related).filter(pk=pk).first()
+    if task is None:
+        task = ArchivedTask.objects.select_related(*related).filter(pk=pk).first()
+    if task is None:
+        raise Http404("Задача не найдена")
+    return task
+
+
+def get_tasks_by_ids(ids):
+    ids = set(ids)
+    if not ids:
+        return []
+    tasks = list(Task.objects.filter(pk__in=ids))
+    missing = ids - {task.pk for task in tasks}
+    if missing:
+        tasks += list(ArchivedTask.objects.filter(pk__in=missing))
+    return sorted(tasks, key=lambda task: task.created_at, reverse=True)
+
+
+def get_blockers(task):
+    """Задачи, которые блокируют `task`, из обеих таблиц."""
+    ids = set(
+        ArchivedTaskEdge.objects.filter(from_task_id=task.pk).values_list(
+            "to_task_id", flat=True
+        )
+    )
+    if not getattr(task, "is_archived", False):
+        ids.update(task.blocked_by.values_list("pk", flat=True))
+    return get_tasks_by_ids(ids)
+
+
+def get_blocked(task):
+    """Задачи, которые блокирует `task`, из обеих таблиц."""
+    ids = set(
+        ArchivedTaskEdge.objects.filter(to_task_id=task.pk).values_list(
+            "from_task_id", flat=True
+        )
+    )
+    if not getattr(task, "is_archived", False):
+        ids.update(task.blocking.values_list("pk", flat=True))
+    return get_tasks_by_ids(ids)
+
+
+class SearchResults:
+    """Результаты поиска по горячей таблице и архиву для Paginator.
+
+    Каждая срезка запрашивает из обеих таблиц не больше `stop` строк,
+    отсортированных в SQL, и сливает их по дате создания.
+    """
+
+    def __init__(self, query):
+        lookup = Q(title__icontains=query) | Q(description__icontains=query)
+        self.sources = [
+            model.objects.filter(lookup)
+            .select_related("category", "assigned_to")
+            .order_by("-created_at", "-pk")
+            for model in (Task, ArchivedTask)
+        ]
+
+    def count(self):
+        return sum(tasks.count() for tasks in self.sources)
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index : index + 1][0]
+        start, stop = index.start or 0, index.stop
+        merged = heapq.merge(
+            *(tasks[:stop] for tasks in self.sources),
+            key=lambda task: (task.created_at, task.pk),
+            reverse=True,
+        )
+        return list(islice(merged, start, stop))
+
+
+def search_tasks(query):
+    """Поиск по названию и описанию в горячей таблице и в архиве."""
+    return SearchResults(query)
+
+
+def user_task_sources(user):
+    """Querysets задач пользователя: горячая таблица и архив."""
+    return [
+        Task.objects.filter(assigned_to=user),
+        ArchivedTask.objects.filter(assigned_to=user),
+    ]
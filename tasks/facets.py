@@ -0,0 +1,102 @@
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, Count, IntegerField, Q, Value, When
+from django.utils import timezone
+
+from .models import TASK_FACETS_CACHE_KEY, Task
+
+DATE_FILTER_CHOICES = [
+    ("today", "Сегодня"),
+    ("week", "На неделе"),
+    ("overdue", "Просрочено"),
+]
+
+FACET_FIELDS = {
+    "category": "category_id",
+    "status": "status",
+    "priority": "priority",
+}
+
+
+def date_filter_q(date_filter):
+    """Условие для фильтра по дедлайну из списка задач."""
+    today = timezone.now().date()
+    if date_filter == "today":
+        return Q(deadline__date=today)
+    if date_filter == "week":
+        week_end = today + timedelta(days=7)
+        return Q(deadline__date__gte=today, deadline__date__lte=week_end)
+    if date_filter == "overdue":
+        return Q(deadline__lt=timezone.now()) & ~Q(status="done")
+    return Q()
+
+
+def get_facet_rows():
+    """Число задач в каждой комбинации категория × статус × приоритет × дата.
+
+    Считается одним GROUP BY-запросом и кешируется; кеш сбрасывается
+    сигналами при изменении задач и категорий.
+    """
+    today = timezone.now().date()
+    cached = cache.get(TASK_FACETS_CACHE_KEY)
+    if cached is not None and cached[0] == today:
+        return cached[1]
+
+    flags = {
+        bucket: Case(
+            When(date_filter_q(bucket), then=Value(1)),
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+        for bucket, _ in DATE_FILTER_CHOICES
+    }
+    rows = list(
+        Task.objects.annotate(**flags)
+        .values(*FACET_FIELDS.values(), *flags)
+        .annotate(count=Count("pk"))
+        .order_by()
+    )
+    cache.set(TASK_FACETS_CACHE_KEY, (today, rows), settings.TASK_FACETS_CACHE_TIMEOUT)
+    return rows
+
+
+def _row_matches(row, name, value):
+    if name == "date_filter":
+        return bool(row.get(value))
+    return str(row[FACET_FIELDS[name]]) == value
+
+
+def get_facet_counts(filters):
+    """Счётчики для панели фильтров с учётом остальных активных фильтров.
+
+    `filters` — значения из GET (category, status, priority, date_filter).
+    Для каждого измерения возвращается словарь «значение → число задач»,
+    под ключом "" — общее число задач без фильтра по этому измерению.
+    """
+    buckets = dict(DATE_FILTER_CHOICES)
+    active = {
+        name: value
+        for name, value in filters.items()
+        if value and (name != "date_filter" or value in buckets)
+    }
+    counts = {name: defaultdict(int) for name in [*FACET_FIELDS, "date_filter"]}
+
+    for row in get_facet_rows():
+        matches = {
+            name: _row_matches(row, name, value) for name, value in active.items()
+        }
+        for name, facet in counts.items():
+            if not all(ok for other, ok in matches.items() if other != name):
+                continue
+            facet[""] += row["count"]
+            if name == "date_filter":
+                for bucket in buckets:
+                    if row[bucket]:
+                        facet[bucket] += row["count"]
+            else:
+                facet[str(row[FACET_FIELDS[name]])] += row["count"]
+
+    return counts
@@ -0,0 +1,36 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from tasks.archive import archive_done_tasks
+
+
+class Command(BaseCommand):
+    help = "Переносит выполненные задачи и их связи blocked_by в архив"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.TASK_ARCHIVE_AFTER_DAYS,
+            help="Архивировать задачи, выполненные больше N дней назад",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.TASK_ARCHIVE_BATCH_SIZE,
+            help="Количество задач в одной транзакции",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Остановиться после N порций (продолжить можно повторным запуском)",
+        )
+
+    def handle(self, *args, **options):
+        moved = archive_done_tasks(
+            days=options["days"],
+            batch_size=options["batch_size"],
+            max_batches=options["max_batches"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Перенесено в архив задач: {moved}"))
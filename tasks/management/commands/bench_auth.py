@@ -0,0 +1,80 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+from django.test.utils import (
+    CaptureQueriesContext,
+    override_settings,
+    setup_test_environment,
+    teardown_test_environment,
+)
+from django.urls import reverse
+
+WRITE_PREFIXES = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+def count_queries(queries):
+    writes = sum(
+        1
+        for query in queries
+        if query["sql"].lstrip().upper().startswith(WRITE_PREFIXES)
+    )
+    return len(queries), writes
+
+
+class Command(BaseCommand):
+    help = (
+        "Считает запросы и записи в БД на один вход и на один просмотр "
+        "страницы для каждого хранилища сессий (на тестовой базе)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--views",
+            type=int,
+            default=10,
+            help="Сколько раз открыть страницы после входа",
+        )
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            User.objects.create_user("bench", password="bench-password")
+            self.stdout.write(
+                f"{'сессии':<8} {'вход: запросов':>15} {'записей':>8} "
+                f"{'страница: запросов':>19} {'записей':>8}"
+            )
+            for mode, engine in settings.SESSION_MODES.items():
+                with override_settings(SESSION_ENGINE=engine):
+                    login, view = self.measure(options["views"])
+                self.stdout.write(
+                    f"{mode:<8} {login[0]:>15} {login[1]:>8} "
+                    f"{view[0]:>19.1f} {view[1]:>8.1f}"
+                )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+    def measure(self, views):
+        client = Client()
+        client.get(reverse("login"))
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post(
+                reverse("login"),
+                {"username": "bench", "password": "bench-password"},
+            )
+        if response.status_code != 302:
+            raise RuntimeError("Не удалось войти под тестовым пользователем")
+        login = count_queries(queries.captured_queries)
+
+        urls = [reverse("profile", args=["bench"]), reverse("profile_edit")]
+        total = writes = 0
+        for i in range(views):
+            with CaptureQueriesContext(connection) as queries:
+                client.get(urls[i % len(urls)])
+            page_total, page_writes = count_queries(queries.captured_queries)
+            total += page_total
+            writes += page_writes
+        return login, (total / views, writes / views)
@@ -0,0 +1,122 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+from django.test import RequestFactory
+from django.utils import timezone
+
+from tasks.models import Category, Task
+from tasks.views import build_kanban_columns
+
+TEMPLATE_NAMES = {
+    "kanban": "tasks/kanban.html",
+    "list": "tasks/task_list.html",
+}
+
+
+def uncached_backend():
+    """Бэкенд с теми же настройками, но без кеширующего загрузчика."""
+    params = dict(settings.TEMPLATES[0])
+    params.pop("BACKEND")
+    params["APP_DIRS"] = False
+    params["OPTIONS"] = {
+        **params["OPTIONS"],
+        "loaders": [
+            "django.template.loaders.filesystem.Loader",
+            "django.template.loaders.app_directories.Loader",
+        ],
+    }
+    params["NAME"] = "bench_uncached"
+    return DjangoTemplates(params)
+
+
+def make_tasks(count):
+    """Несохранённые задачи с заполненными полями карточек — без обращений к БД."""
+    now = timezone.now()
+    categories = [Category(pk=i, name=f"Категория {i}") for i in range(1, 7)]
+    users = [User(pk=i, username=f"user{i}") for i in range(1, 21)]
+    statuses = [code for code, _ in Task.STATUS_CHOICES]
+    priorities = [code for code, _ in Task.PRIORITY_CHOICES]
+
+    tasks = []
+    for i in range(count):
+        task = Task(
+            pk=i + 1,
+            title=f"Задача {i + 1}",
+            description="Описание задачи для замера отрисовки шаблона " * 3,
+            status=statuses[i % len(statuses)],
+            priority=priorities[i % len(priorities)],
+            category=categories[i % len(categories)],
+            assigned_to=users[i % len(users)],
+            estimated_hours=i % 8 or None,
+            deadline=now + timedelta(days=i % 14 - 7),
+            created_at=now,
+        )
+        task.blocked_by_count = i % 3
+        task.blocking_count = i % 2
+        task.is_overdue = task.deadline < now and task.status != "done"
+        tasks.append(task)
+    return tasks
+
+
+class Command(BaseCommand):
+    help = (
+        "Замеряет время отрисовки шаблонов Kanban-доски и списка задач "
+        "для заданного числа карточек (без запросов к БД)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[1000, 10000, 100000],
+            help="Количество карточек на странице",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Число повторов, берётся лучшее время",
+        )
+
+    def handle(self, *args, **options):
+        request = RequestFactory().get("/")
+        request.user = User(pk=1, username="bench")
+        backends = {
+            "cached": engines["django"],
+            "uncached": uncached_backend(),
+        }
+        self.stdout.write(
+            f"DEBUG={settings.DEBUG}; cached — загрузчики Django по умолчанию, "
+            "uncached — шаблон загружается и компилируется при каждой отрисовке"
+        )
+        self.stdout.write(
+            f"{'карточек':>9} {'шаблон':<8} {'загрузчик':<9} {'мс':>10} "
+            f"{'мкс/карточку':>13}"
+        )
+        for size in options["sizes"]:
+            tasks = make_tasks(size)
+            contexts = {
+                "kanban": {"columns": build_kanban_columns(tasks)},
+                "list": {"tasks": tasks, "facet_totals": {}},
+            }
+            for name, template_name in TEMPLATE_NAMES.items():
+                for loader, backend in backends.items():
+                    best = min(
+                        self.measure(backend, template_name, contexts[name], request)
+                        for _ in range(options["repeat"])
+                    )
+                    self.stdout.write(
+                        f"{size:>9} {name:<8} {loader:<9} {best * 1000:>10.1f} "
+                        f"{best / size * 1e6:>13.1f}"
+                    )
+
+    def measure(self, backend, template_name, context, request):
+        started = time.perf_counter()
+        backend.get_template(template_name).render(context, request)
+        return time.perf_counter() - started
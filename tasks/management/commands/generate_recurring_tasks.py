@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from tasks.recurring import generate_due_tasks
+
+
+class Command(BaseCommand):
+    help = "Создаёт задачи по наступившим повторениям шаблонов"
+
+    def handle(self, *args, **options):
+        created = generate_due_tasks()
+        self.stdout.write(self.style.SUCCESS(f"Создано задач: {created}"))
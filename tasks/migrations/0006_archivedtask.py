@@ -0,0 +1,51 @@
+# Generated by Django 6.0 on 2026-10-19 18:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_profile'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedTaskEdge',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_task_id', models.BigIntegerField(db_index=True, verbose_name='Заблокированная задача')),
+                ('to_task_id', models.BigIntegerField(db_index=True, verbose_name='Блокирующая задача')),
+            ],
+            options={
+                'verbose_name': 'Архивная связь задач',
+                'verbose_name_plural': 'Архивные связи задач',
+                'constraints': [models.UniqueConstraint(fields=('from_task_id', 'to_task_id'), name='unique_archived_edge')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedTask',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=200, verbose_name='Название')),
+                ('description', models.TextField(blank=True, verbose_name='Описание')),
+                ('created_at', models.DateTimeField(verbose_name='Дата создания')),
+                ('deadline', models.DateTimeField(blank=True, null=True, verbose_name='Дедлайн')),
+                ('estimated_hours', models.PositiveIntegerField(blank=True, null=True, verbose_name='Оценка времени (часы)')),
+                ('priority', models.CharField(choices=[('low', 'Низкий'), ('medium', 'Средний'), ('high', 'Высокий')], default='medium', max_length=10, verbose_name='Приоритет')),
+                ('status', models.CharField(choices=[('todo', 'Нужно сделать'), ('in_progress', 'В работе'), ('review', 'Ревью'), ('blocked', 'Ждёт связанные таски'), ('ready_test', 'Готово к тестированию'), ('testing', 'Тестирование'), ('tested', 'Протестировано'), ('ready_deploy', 'Готово к деплою'), ('done', 'Выполнено')], default='done', max_length=20, verbose_name='Статус')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='Дата архивации')),
+                ('assigned_to', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_tasks', to=settings.AUTH_USER_MODEL, verbose_name='Исполнитель')),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_tasks', to='tasks.category', verbose_name='Категория')),
+            ],
+            options={
+                'verbose_name': 'Архивная задача',
+                'verbose_name_plural': 'Архивные задачи',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['assigned_to', 'created_at'], name='tasks_archi_assigne_b27b4b_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-19 19:05
+
+from django.conf import settings
+from django.db import migrations
+
+
+def create_missing_profiles(apps, schema_editor):
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    Profile = apps.get_model('tasks', 'Profile')
+    user_ids = User.objects.filter(profile__isnull=True).values_list('pk', flat=True)
+    Profile.objects.bulk_create([Profile(user_id=pk) for pk in user_ids])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0006_archivedtask'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(create_missing_profiles, migrations.RunPython.noop),
+    ]
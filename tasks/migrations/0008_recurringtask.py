@@ -0,0 +1,57 @@
+# Generated by Django 6.0 on 2026-10-19 19:30
+
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0007_create_missing_profiles'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='occurrence_date',
+            field=models.DateField(editable=False, null=True, verbose_name='Дата повторения'),
+        ),
+        migrations.CreateModel(
+            name='RecurringTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200, verbose_name='Название')),
+                ('description', models.TextField(blank=True, verbose_name='Описание')),
+                ('priority', models.CharField(choices=[('low', 'Низкий'), ('medium', 'Средний'), ('high', 'Высокий')], default='medium', max_length=10, verbose_name='Приоритет')),
+                ('estimated_hours', models.PositiveIntegerField(blank=True, null=True, verbose_name='Оценка времени (часы)')),
+                ('frequency', models.CharField(choices=[('daily', 'Ежедневно'), ('weekly', 'Еженедельно'), ('monthly', 'Ежемесячно')], default='weekly', max_length=10, verbose_name='Периодичность')),
+                ('interval', models.PositiveSmallIntegerField(default=1, validators=[django.core.validators.MinValueValidator(1)], verbose_name='Интервал')),
+                ('starts_at', models.DateTimeField(verbose_name='Первое повторение')),
+                ('next_due', models.DateTimeField(blank=True, verbose_name='Следующее повторение')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Активен')),
+                ('assigned_to', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='recurring_tasks', to=settings.AUTH_USER_MODEL, verbose_name='Исполнитель')),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='recurring_tasks', to='tasks.category', verbose_name='Категория')),
+            ],
+            options={
+                'verbose_name': 'Повторяющаяся задача',
+                'verbose_name_plural': 'Повторяющиеся задачи',
+                'ordering': ['next_due'],
+            },
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='recurring_task',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='occurrences', to='tasks.recurringtask', verbose_name='Шаблон'),
+        ),
+        migrations.AddConstraint(
+            model_name='task',
+            constraint=models.UniqueConstraint(fields=('recurring_task', 'occurrence_date'), name='unique_recurring_occurrence'),
+        ),
+        migrations.AddIndex(
+            model_name='recurringtask',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['next_due'], name='recurring_active_next_due'),
+        ),
+    ]
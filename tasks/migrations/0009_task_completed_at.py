@@ -0,0 +1,35 @@
+# Generated by Django 6.0 on 2026-10-19 21:10
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_completed_at(apps, schema_editor):
+    # Дата выполнения раньше не хранилась: для уже выполненных задач
+    # берём дату создания.
+    for model_name in ('Task', 'ArchivedTask'):
+        model = apps.get_model('tasks', model_name)
+        model.objects.filter(status='done', completed_at__isnull=True).update(
+            completed_at=F('created_at')
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0008_recurringtask'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='completed_at',
+            field=models.DateTimeField(editable=False, null=True, verbose_name='Дата выполнения'),
+        ),
+        migrations.AddField(
+            model_name='archivedtask',
+            name='completed_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Дата выполнения'),
+        ),
+        migrations.RunPython(backfill_completed_at, migrations.RunPython.noop),
+    ]
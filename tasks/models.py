@@ -1,7 +1,13 @@
+import calendar
+from datetime import timedelta
+
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.validators import MinValueValidator
 from django.db import models
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from django.utils import timezone
 
 
 class Profile(models.Model):
@@ -23,12 +29,6 @@ def create_user_profile(sender, instance, created, **kwargs):
         Profile.objects.create(user=instance)
 
 
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    if hasattr(instance, "profile"):
-        instance.profile.save()
-
-
 class Category(models.Model):
     name = models.CharField("Название", max_length=100)
 
@@ -96,11 +96,201 @@ class Task(models.Model):
         related_name="blocking",
         verbose_name="Блокируется задачами",
     )
+    recurring_task = models.ForeignKey(
+        "RecurringTask",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Шаблон",
+        related_name="occurrences",
+    )
+    occurrence_date = models.DateField("Дата повторения", null=True, editable=False)
+    completed_at = models.DateTimeField("Дата выполнения", null=True, editable=False)
 
     class Meta:
         verbose_name = "Задача"
         verbose_name_plural = "Задачи"
         ordering = ["-created_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["recurring_task", "occurrence_date"],
+                name="unique_recurring_occurrence",
+            ),
+        ]
+
+    def __str__(self):
+        return self.title
+
+    def save(self, *args, **kwargs):
+        if self.status != "done":
+            self.completed_at = None
+        elif self.completed_at is None:
+            self.completed_at = timezone.now()
+        super().save(*args, **kwargs)
+
+    @property
+    def is_completed(self):
+        return self.status == "done"
+
+
+class RecurringTask(models.Model):
+    FREQUENCY_CHOICES = [
+        ("daily", "Ежедневно"),
+        ("weekly", "Еженедельно"),
+        ("monthly", "Ежемесячно"),
+    ]
+
+    SCHEDULE_FIELDS = ["starts_at", "frequency", "interval"]
+
+    title = models.CharField("Название", max_length=200)
+    description = models.TextField("Описание", blank=True)
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name="Категория",
+        related_name="recurring_tasks",
+    )
+    assigned_to = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name="Исполнитель",
+        related_name="recurring_tasks",
+    )
+    priority = models.CharField(
+        "Приоритет", max_length=10, choices=Task.PRIORITY_CHOICES, default="medium"
+    )
+    estimated_hours = models.PositiveIntegerField(
+        "Оценка времени (часы)", null=True, blank=True
+    )
+    frequency = models.CharField(
+        "Периодичность", max_length=10, choices=FREQUENCY_CHOICES, default="weekly"
+    )
+    interval = models.PositiveSmallIntegerField(
+        "Интервал", default=1, validators=[MinValueValidator(1)]
+    )
+    starts_at = models.DateTimeField("Первое повторение")
+    next_due = models.DateTimeField("Следующее повторение", blank=True)
+    is_active = models.BooleanField("Активен", default=True)
+
+    class Meta:
+        verbose_name = "Повторяющаяся задача"
+        verbose_name_plural = "Повторяющиеся задачи"
+        ordering = ["next_due"]
+        indexes = [
+            models.Index(
+                fields=["next_due"],
+                condition=models.Q(is_active=True),
+                name="recurring_active_next_due",
+            ),
+        ]
+
+    def __str__(self):
+        return self.title
+
+    def save(self, *args, **kwargs):
+        if self.next_due is None:
+            self.next_due = self.starts_at
+        elif self.pk is not None:
+            previous = (
+                RecurringTask.objects.filter(pk=self.pk)
+                .values(*self.SCHEDULE_FIELDS, "next_due")
+                .first()
+            )
+            changed = previous is not None and any(
+                previous[field] != getattr(self, field)
+                for field in self.SCHEDULE_FIELDS
+            )
+            if changed:
+                # Повторения до прежнего next_due уже созданы по старому
+                # правилу, дальше считаем по новому.
+                self.next_due = self.first_due_from(previous["next_due"])
+        super().save(*args, **kwargs)
+
+    def first_due_from(self, moment):
+        """Первое повторение по текущему правилу не раньше `moment`."""
+        due = self.starts_at
+        while due < moment:
+            due = self.following(due)
+        return due
+
+    def following(self, moment):
+        """Момент повторения, следующий за `moment`."""
+        if self.frequency == "daily":
+            return moment + timedelta(days=self.interval)
+        if self.frequency == "weekly":
+            return moment + timedelta(weeks=self.interval)
+        local = timezone.localtime(moment)
+        months = local.month - 1 + self.interval
+        year = local.year + months // 12
+        month = months % 12 + 1
+        anchor_day = timezone.localtime(self.starts_at).day
+        day = min(anchor_day, calendar.monthrange(year, month)[1])
+        return local.replace(year=year, month=month, day=day)
+
+
+TASK_FACETS_CACHE_KEY = "tasks:facets"
+
+
+@receiver([post_save, post_delete], sender=Task)
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_task_facets(sender, **kwargs):
+    cache.delete(TASK_FACETS_CACHE_KEY)
+
+
+class ArchivedTask(models.Model):
+    """Выполненная задача, перенесённая из горячей таблицы tasks_task.
+
+    Первичный ключ совпадает с id исходной задачи, поэтому ссылки вида
+    /task/<id>/ остаются рабочими после архивации.
+    """
+
+    is_archived = True
+
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField("Название", max_length=200)
+    description = models.TextField("Описание", blank=True)
+    created_at = models.DateTimeField("Дата создания")
+    deadline = models.DateTimeField("Дедлайн", null=True, blank=True)
+    estimated_hours = models.PositiveIntegerField(
+        "Оценка времени (часы)", null=True, blank=True
+    )
+    priority = models.CharField(
+        "Приоритет", max_length=10, choices=Task.PRIORITY_CHOICES, default="medium"
+    )
+    status = models.CharField(
+        "Статус", max_length=20, choices=Task.STATUS_CHOICES, default="done"
+    )
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name="Категория",
+        related_name="archived_tasks",
+    )
+    assigned_to = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name="Исполнитель",
+        related_name="archived_tasks",
+    )
+    completed_at = models.DateTimeField("Дата выполнения", null=True, blank=True)
+    archived_at = models.DateTimeField("Дата архивации", auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Архивная задача"
+        verbose_name_plural = "Архивные задачи"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["assigned_to", "created_at"]),
+        ]
 
     def __str__(self):
         return self.title
@@ -108,3 +298,26 @@ class Task(models.Model):
     @property
     def is_completed(self):
         return self.status == "done"
+
+
+class ArchivedTaskEdge(models.Model):
+    """Связь blocked_by, в которой участвует хотя бы одна архивная задача.
+
+    Идентификаторы хранятся без внешних ключей: вторая задача связи может
+    находиться как в горячей, так и в архивной таблице.
+    """
+
+    from_task_id = models.BigIntegerField("Заблокированная задача", db_index=True)
+    to_task_id = models.BigIntegerField("Блокирующая задача", db_index=True)
+
+    class Meta:
+        verbose_name = "Архивная связь задач"
+        verbose_name_plural = "Архивные связи задач"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["from_task_id", "to_task_id"], name="unique_archived_edge"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.from_task_id} ← {self.to_task_id}"
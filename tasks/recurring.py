@@ -0,0 +1,67 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from .models import TASK_FACETS_CACHE_KEY, RecurringTask, Task
+
+
+def build_occurrence(template, due):
+    """Задача для повторения `due`; дедлайн — момент следующего повторения."""
+    return Task(
+        title=template.title,
+        description=template.description,
+        category_id=template.category_id,
+        assigned_to_id=template.assigned_to_id,
+        priority=template.priority,
+        estimated_hours=template.estimated_hours,
+        deadline=template.following(due),
+        recurring_task=template,
+        occurrence_date=timezone.localtime(due).date(),
+    )
+
+
+def generate_due_tasks(now=None):
+    """Создаёт задачи по всем наступившим повторениям шаблонов.
+
+    Читает только активные шаблоны с next_due <= now (частичный индекс
+    recurring_active_next_due) и досоздаёт пропущенные повторения, если
+    генератор давно не запускался. Все задачи вставляются одним
+    bulk_create; повторения, для которых задача уже есть (например, после
+    отката next_due), пропускаются, а уникальность (шаблон, дата повторения)
+    защищает от дублей. Возвращает число созданных задач.
+    """
+    if now is None:
+        now = timezone.now()
+
+    with transaction.atomic():
+        templates = list(
+            RecurringTask.objects.select_for_update().filter(
+                is_active=True, next_due__lte=now
+            )
+        )
+        tasks = []
+        for template in templates:
+            due = template.next_due
+            while due <= now:
+                tasks.append(build_occurrence(template, due))
+                due = template.following(due)
+            template.next_due = due
+
+        if tasks:
+            existing = set(
+                Task.objects.filter(
+                    recurring_task__in=templates,
+                    occurrence_date__gte=min(task.occurrence_date for task in tasks),
+                ).values_list("recurring_task_id", "occurrence_date")
+            )
+            tasks = [
+                task
+                for task in tasks
+                if (task.recurring_task_id, task.occurrence_date) not in existing
+            ]
+        Task.objects.bulk_create(tasks, ignore_conflicts=True)
+        RecurringTask.objects.bulk_update(templates, ["next_due"])
+
+    if tasks:
+        cache.delete(TASK_FACETS_CACHE_KEY)
+    return len(tasks)
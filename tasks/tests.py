@@ -1,3 +1,422 @@
+from datetime import datetime, timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .archive import get_blocked, get_blockers, get_task
+from .facets import DATE_FILTER_CHOICES, date_filter_q, get_facet_counts
+from .views import build_kanban_columns, with_card_data
+from .models import (
+    TASK_FACETS_CACHE_KEY,
+    ArchivedTask,
+    ArchivedTaskEdge,
+    Category,
+    RecurringTask,
+    Task,
+)
+from .recurring import generate_due_tasks
+
+
+def make_task(title, status="todo", age_days=0, done_days=None):
+    """Задача, созданная `age_days` и выполненная `done_days` дней назад."""
+    task = Task.objects.create(title=title, status=status)
+    now = timezone.now()
+    changes = {}
+    if age_days:
+        changes["created_at"] = now - timedelta(days=age_days)
+    if status == "done":
+        if done_days is None:
+            done_days = age_days
+        changes["completed_at"] = now - timedelta(days=done_days)
+    if changes:
+        Task.objects.filter(pk=task.pk).update(**changes)
+        task.refresh_from_db()
+    return task
+
+
+class ArchiveTasksTests(TestCase):
+    def setUp(self):
+        self.old_done = [make_task(f"old {i}", "done", age_days=200) for i in range(5)]
+        self.recent_done = make_task("recent", "done", age_days=200, done_days=1)
+        self.old_todo = make_task("old todo", "todo", age_days=200)
+        # old_todo ждёт old_done[0], old_done[1] ждёт old_todo
+        self.old_todo.blocked_by.add(self.old_done[0])
+        self.old_done[1].blocked_by.add(self.old_todo)
+        # связь между двумя горячими задачами не трогается
+        self.old_todo.blocked_by.add(self.recent_done)
+
+    def archive(self, *args):
+        call_command("archive_tasks", "--days", "90", *args, stdout=StringIO())
+
+    def test_moves_old_done_tasks_and_their_edges(self):
+        self.archive()
+
+        archived_ids = {task.pk for task in self.old_done}
+        self.assertEqual(
+            set(ArchivedTask.objects.values_list("pk", flat=True)), archived_ids
+        )
+        self.assertFalse(Task.objects.filter(pk__in=archived_ids).exists())
+        self.assertEqual(
+            set(Task.objects.values_list("pk", flat=True)),
+            {self.recent_done.pk, self.old_todo.pk},
+        )
+
+        archived = ArchivedTask.objects.get(pk=self.old_done[0].pk)
+        self.assertEqual(archived.title, "old 0")
+        self.assertEqual(archived.status, "done")
+
+        self.assertEqual(
+            set(ArchivedTaskEdge.objects.values_list("from_task_id", "to_task_id")),
+            {
+                (self.old_todo.pk, self.old_done[0].pk),
+                (self.old_done[1].pk, self.old_todo.pk),
+            },
+        )
+        self.assertEqual(
+            list(self.old_todo.blocked_by.values_list("pk", flat=True)),
+            [self.recent_done.pk],
+        )
+
+    def test_selects_by_completion_date(self):
+        self.archive()
+
+        self.assertTrue(Task.objects.filter(pk=self.recent_done.pk).exists())
+        archived = ArchivedTask.objects.get(pk=self.old_done[0].pk)
+        self.assertEqual(archived.completed_at, self.old_done[0].completed_at)
+
+    def test_save_tracks_completed_at(self):
+        task = make_task("flow")
+        self.assertIsNone(task.completed_at)
+
+        task.status = "done"
+        task.save()
+        completed_at = task.completed_at
+        self.assertIsNotNone(completed_at)
+
+        task.title = "flow, renamed"
+        task.save()
+        self.assertEqual(task.completed_at, completed_at)
+
+        task.status = "in_progress"
+        task.save()
+        self.assertIsNone(task.completed_at)
+
+    def test_batches_continue_after_last_archived_pk(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.archive("--batch-size", "2")
+
+        self.assertEqual(ArchivedTask.objects.count(), 5)
+        selects = [
+            query["sql"]
+            for query in queries.captured_queries
+            if '"tasks_task"."completed_at" <' in query["sql"]
+        ]
+        self.assertEqual(len(selects), 4)
+        self.assertTrue(all('"tasks_task"."id" >' in sql for sql in selects))
+
+    def test_resumes_after_max_batches(self):
+        self.archive("--batch-size", "2", "--max-batches", "1")
+        self.assertEqual(ArchivedTask.objects.count(), 2)
+        self.assertEqual(Task.objects.filter(status="done").count(), 4)
+
+        self.archive("--batch-size", "2")
+        self.assertEqual(ArchivedTask.objects.count(), 5)
+        self.assertEqual(Task.objects.filter(status="done").count(), 1)
+
+        self.archive("--batch-size", "2")
+        self.assertEqual(ArchivedTask.objects.count(), 5)
+
+    def test_read_path_spans_hot_and_archived_tasks(self):
+        self.archive()
+
+        archived = get_task(self.old_done[0].pk)
+        self.assertIsInstance(archived, ArchivedTask)
+        hot = get_task(self.old_todo.pk)
+        self.assertIsInstance(hot, Task)
+
+        self.assertEqual(
+            {task.pk for task in get_blockers(hot)},
+            {self.old_done[0].pk, self.recent_done.pk},
+        )
+        self.assertEqual({task.pk for task in get_blocked(hot)}, {self.old_done[1].pk})
+        self.assertEqual({task.pk for task in get_blocked(archived)}, {hot.pk})
+        self.assertEqual(
+            {task.pk for task in get_blockers(get_task(self.old_done[1].pk))},
+            {hot.pk},
+        )
+
+
+class GenerateRecurringTasksTests(TestCase):
+    def test_catches_up_missed_periods(self):
+        now = timezone.now()
+        template = RecurringTask.objects.create(
+            title="weekly",
+            frequency="weekly",
+            starts_at=now - timedelta(days=21, hours=1),
+        )
+
+        self.assertEqual(generate_due_tasks(now), 4)
+
+        occurrences = Task.objects.filter(recurring_task=template)
+        self.assertEqual(occurrences.count(), 4)
+        template.refresh_from_db()
+        self.assertGreater(template.next_due, now)
+        latest = occurrences.order_by("-occurrence_date").first()
+        self.assertGreater(latest.deadline, now)
+
+    def test_rerun_creates_no_duplicates(self):
+        now = timezone.now()
+        template = RecurringTask.objects.create(
+            title="daily", frequency="daily", starts_at=now - timedelta(days=2)
+        )
+        generate_due_tasks(now)
+        self.assertEqual(Task.objects.count(), 3)
+
+        self.assertEqual(generate_due_tasks(now), 0)
+        self.assertEqual(Task.objects.count(), 3)
+
+        # даже если next_due откатился, повторения не дублируются
+        RecurringTask.objects.filter(pk=template.pk).update(next_due=template.starts_at)
+        self.assertEqual(generate_due_tasks(now), 0)
+        self.assertEqual(Task.objects.count(), 3)
+
+    def test_schedule_change_recomputes_next_due(self):
+        now = timezone.now()
+        template = RecurringTask.objects.create(
+            title="daily", frequency="daily", starts_at=now - timedelta(days=2)
+        )
+        generate_due_tasks(now)
+        template.refresh_from_db()
+        frontier = template.next_due
+
+        template.frequency = "weekly"
+        template.save()
+        self.assertEqual(template.next_due, template.starts_at + timedelta(weeks=1))
+
+        template.starts_at = now + timedelta(days=10)
+        template.save()
+        self.assertEqual(template.next_due, template.starts_at)
+
+        template.title = "renamed"
+        template.next_due = frontier
+        template.save()
+        template.refresh_from_db()
+        self.assertEqual(template.next_due, frontier)
+
+    def test_monthly_rule_clamps_to_month_end_and_keeps_anchor(self):
+        starts_at = timezone.make_aware(datetime(2026, 1, 31, 9, 0))
+        template = RecurringTask.objects.create(
+            title="monthly", frequency="monthly", starts_at=starts_at
+        )
+
+        generate_due_tasks(timezone.make_aware(datetime(2026, 4, 1)))
+
+        dates = Task.objects.filter(recurring_task=template).values_list(
+            "occurrence_date", flat=True
+        )
+        self.assertEqual(
+            sorted(day.isoformat() for day in dates),
+            ["2026-01-31", "2026-02-28", "2026-03-31"],
+        )
+        template.refresh_from_db()
+        self.assertEqual(
+            timezone.localtime(template.next_due).date().isoformat(), "2026-04-30"
+        )
+
+    def test_skips_inactive_and_future_templates(self):
+        now = timezone.now()
+        RecurringTask.objects.create(
+            title="off", starts_at=now - timedelta(days=1), is_active=False
+        )
+        RecurringTask.objects.create(title="later", starts_at=now + timedelta(days=1))
+
+        self.assertEqual(generate_due_tasks(now), 0)
+        self.assertFalse(Task.objects.exists())
+
+
+class FacetCountsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        now = timezone.now()
+        self.work = Category.objects.create(name="work")
+        self.home = Category.objects.create(name="home")
+        for title, status, priority, category, deadline in [
+            ("a", "todo", "high", self.work, now - timedelta(days=2)),
+            ("b", "todo", "low", self.home, now + timedelta(hours=1)),
+            ("c", "done", "high", self.work, now - timedelta(days=1)),
+            ("d", "done", "medium", self.home, now + timedelta(days=3)),
+            ("e", "in_progress", "high", None, None),
+        ]:
+            Task.objects.create(
+                title=title,
+                status=status,
+                priority=priority,
+                category=category,
+                deadline=deadline,
+            )
+
+    def test_active_filter_narrows_other_facets_only(self):
+        counts = get_facet_counts({"status": "done"})
+
+        self.assertEqual(counts["status"][""], 5)
+        self.assertEqual(counts["status"]["todo"], 2)
+        self.assertEqual(counts["status"]["done"], 2)
+        self.assertEqual(counts["status"]["in_progress"], 1)
+
+        self.assertEqual(counts["category"][""], 2)
+        self.assertEqual(counts["category"][str(self.work.pk)], 1)
+        self.assertEqual(counts["category"][str(self.home.pk)], 1)
+        self.assertEqual(counts["priority"]["high"], 1)
+        self.assertEqual(counts["priority"]["low"], 0)
+        self.assertEqual(counts["date_filter"][""], 2)
+        self.assertEqual(counts["date_filter"]["overdue"], 0)
+
+    def test_date_buckets_match_date_filter_q(self):
+        counts = get_facet_counts({})
+        for bucket, _ in DATE_FILTER_CHOICES:
+            with self.subTest(bucket=bucket):
+                self.assertEqual(
+                    counts["date_filter"][bucket],
+                    Task.objects.filter(date_filter_q(bucket)).count(),
+                )
+
+        narrowed = get_facet_counts({"date_filter": "overdue"})
+        self.assertEqual(
+            narrowed["status"][""],
+            Task.objects.filter(date_filter_q("overdue")).count(),
+        )
+
+    def assertInvalidates(self, action):
+        get_facet_counts({})
+        self.assertIsNotNone(cache.get(TASK_FACETS_CACHE_KEY))
+        action()
+        self.assertIsNone(cache.get(TASK_FACETS_CACHE_KEY))
+
+    def test_cache_is_cleared_on_changes(self):
+        task = Task.objects.get(title="a")
+
+        def save_task():
+            task.status = "done"
+            task.save()
+
+        self.assertInvalidates(save_task)
+        self.assertInvalidates(task.delete)
+        self.assertInvalidates(self.home.delete)
+        RecurringTask.objects.create(
+            title="daily", frequency="daily", starts_at=timezone.now()
+        )
+        self.assertInvalidates(generate_due_tasks)
+
+        self.assertEqual(get_facet_counts({})["category"][""], Task.objects.count())
+
+
+class AuthWritesTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("tester", password="tester-password")
+
+    def statements(self, queries, prefix):
+        return [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].lstrip().upper().startswith(prefix)
+        ]
+
+    def test_login_does_not_update_profile(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                reverse("login"),
+                {"username": "tester", "password": "tester-password"},
+            )
+        self.assertEqual(response.status_code, 302)
+        updates = self.statements(queries, "UPDATE")
+        self.assertFalse([sql for sql in updates if '"tasks_profile"' in sql])
+
+    def test_profile_pages_do_not_insert(self):
+        self.client.force_login(self.user)
+        for url in [reverse("profile", args=["tester"]), reverse("profile_edit")]:
+            with self.subTest(url=url):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(self.statements(queries, "INSERT"), [])
+
+
+class CardDataTests(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.tasks = [
+            Task.objects.create(title="late", deadline=now - timedelta(days=1)),
+            Task.objects.create(
+                title="late but done", status="done", deadline=now - timedelta(days=1)
+            ),
+            Task.objects.create(
+                title="upcoming", status="review", deadline=now + timedelta(days=1)
+            ),
+            Task.objects.create(title="no deadline", status="review"),
+        ]
+        late, done, upcoming, _ = self.tasks
+        late.blocked_by.add(done, upcoming)
+        upcoming.blocked_by.add(done)
+
+    def test_annotations_match_per_card_queries(self):
+        now = timezone.now()
+        cards = with_card_data(Task.objects.all())
+        self.assertEqual(len(cards), len(self.tasks))
+        for card in cards:
+            with self.subTest(task=card.title):
+                self.assertEqual(card.blocked_by_count, card.blocked_by.count())
+                self.assertEqual(card.blocking_count, card.blocking.count())
+                self.assertEqual(card.blocked_by_count > 0, card.blocked_by.exists())
+                self.assertEqual(card.blocking_count > 0, card.blocking.exists())
+                self.assertEqual(
+                    card.is_overdue,
+                    card.deadline is not None
+                    and card.deadline < now
+                    and card.status != "done",
+                )
+
+    def test_kanban_columns_follow_status_order(self):
+        columns = build_kanban_columns(Task.objects.all())
+
+        self.assertEqual(
+            [column["status"] for column in columns],
+            [code for code, _ in Task.STATUS_CHOICES],
+        )
+        for column in columns:
+            with self.subTest(status=column["status"]):
+                expected = Task.objects.filter(status=column["status"])
+                self.assertEqual(
+                    {task.pk for task in column["tasks"]},
+                    set(expected.values_list("pk", flat=True)),
+                )
+                self.assertEqual(column["count"], expected.count())
+
+
+class PageRenderTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("tester", password="tester-password")
+        self.client.force_login(self.user)
+        category = Category.objects.create(name="Разработка")
+        self.task = Task.objects.create(
+            title="card", category=category, assigned_to=self.user
+        )
+        self.task.blocked_by.add(make_task("blocker"))
 
-# Create your tests here.
+    def test_pages_render(self):
+        for url in [
+            reverse("task_list"),
+            reverse("kanban"),
+            reverse("task_detail", args=[self.task.pk]),
+        ]:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertContains(response, "card")
+                self.assertContains(response, "vendor/bootstrap/css/bootstrap.min.css")
@@ -6,6 +6,7 @@ from . import views
 urlpatterns = [
     path("", views.TaskListView.as_view(), name="task_list"),
     path("kanban/", views.KanbanView.as_view(), name="kanban"),
+    path("search/", views.TaskSearchView.as_view(), name="task_search"),
     path("task/<int:pk>/", views.TaskDetailView.as_view(), name="task_detail"),
     path("task/create/", views.TaskCreateView.as_view(), name="task_create"),
     path("task/<int:pk>/edit/", views.TaskUpdateView.as_view(), name="task_update"),
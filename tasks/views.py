@@ -2,8 +2,19 @@ from datetime import timedelta
 
 from django.contrib.auth import login
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.contrib.auth.models import User
 from django.contrib.auth.views import LoginView
+from django.db.models import (
+    BooleanField,
+    Case,
+    Count,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse_lazy
@@ -18,10 +29,63 @@ from django.views.generic import (
     UpdateView,
 )
 
+from .archive import (
+    get_blocked,
+    get_blockers,
+    get_task,
+    search_tasks,
+    user_task_sources,
+)
+from .facets import DATE_FILTER_CHOICES, date_filter_q, get_facet_counts
 from .forms import ProfileForm, RegisterForm, TaskForm
 from .models import Category, Profile, Task
 
 
+def count_edges(field):
+    """Коррелированный подзапрос: число связей blocked_by задачи по `field`."""
+    edges = (
+        Task.blocked_by.through.objects.filter(**{field: OuterRef("pk")})
+        .order_by()
+        .values(field)
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(edges), 0)
+
+
+def with_card_data(queryset):
+    """Добавляет к задачам данные для карточки списка одним запросом.
+
+    Счётчики считаются подзапросами, а не JOIN + GROUP BY: так сохраняется
+    сортировка и не усложняется COUNT(*) пагинатора.
+    """
+    return queryset.annotate(
+        blocked_by_count=count_edges("from_task_id"),
+        blocking_count=count_edges("to_task_id"),
+        is_overdue=Case(
+            When(date_filter_q("overdue"), then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        ),
+    )
+
+
+def build_kanban_columns(tasks):
+    """Раскладывает задачи по колонкам Kanban-доски в порядке статусов."""
+    by_status = {code: [] for code, _ in Task.STATUS_CHOICES}
+    for task in tasks:
+        by_status[task.status].append(task)
+    return [
+        {
+            "status": code,
+            "label": label,
+            "tasks": by_status[code],
+            "count": len(by_status[code]),
+        }
+        for code, label in Task.STATUS_CHOICES
+    ]
+
+
 class CustomLoginView(LoginView):
     template_name = "registration/login.html"
     redirect_authenticated_user = True
@@ -44,13 +108,13 @@ class ProfileView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         username = self.kwargs.get("username")
-        user = get_object_or_404(User, username=username)
-
-        if not hasattr(user, "profile"):
-            Profile.objects.create(user=user)
+        profile = get_object_or_404(
+            Profile.objects.select_related("user"), user__username=username
+        )
+        user = profile.user
 
         context["profile_user"] = user
-        context["profile"] = user.profile
+        context["profile"] = profile
         context["is_own_profile"] = self.request.user == user
 
         now = timezone.now()
@@ -58,35 +122,53 @@ class ProfileView(LoginRequiredMixin, TemplateView):
         week_start = today_start - timedelta(days=now.weekday())
         month_start = today_start.replace(day=1)
 
-        user_tasks = Task.objects.filter(assigned_to=user)
+        task_sources = user_task_sources(user)
 
-        def get_metrics(start_date):
-            period_tasks = user_tasks.filter(created_at__gte=start_date)
-            completed = period_tasks.filter(status="done").count()
-            total = period_tasks.count()
-            in_progress = period_tasks.filter(status="in_progress").count()
-            hours = sum(
-                t.estimated_hours or 0 for t in period_tasks.filter(status="done")
+        periods = {
+            "today": Q(created_at__gte=today_start),
+            "week": Q(created_at__gte=week_start),
+            "month": Q(created_at__gte=month_start),
+            "all": Q(pk__isnull=False),
+        }
+        aggregates = {}
+        for name, period in periods.items():
+            done = period & Q(status="done")
+            aggregates[f"{name}_total"] = Count("pk", filter=period)
+            aggregates[f"{name}_completed"] = Count("pk", filter=done)
+            aggregates[f"{name}_in_progress"] = Count(
+                "pk", filter=period & Q(status="in_progress")
             )
+            aggregates[f"{name}_hours"] = Sum("estimated_hours", filter=done)
+
+        totals = dict.fromkeys(aggregates, 0)
+        for tasks in task_sources:
+            for key, value in tasks.aggregate(**aggregates).items():
+                totals[key] += value or 0
+
+        def get_metrics(name):
+            completed = totals[f"{name}_completed"]
+            total = totals[f"{name}_total"]
             return {
                 "completed": completed,
                 "total": total,
-                "in_progress": in_progress,
-                "hours": hours,
+                "in_progress": totals[f"{name}_in_progress"],
+                "hours": totals[f"{name}_hours"],
                 "completion_rate": round(completed / total * 100) if total > 0 else 0,
             }
 
-        context["metrics_today"] = get_metrics(today_start)
-        context["metrics_week"] = get_metrics(week_start)
-        context["metrics_month"] = get_metrics(month_start)
+        context["metrics_today"] = get_metrics("today")
+        context["metrics_week"] = get_metrics("week")
+        context["metrics_month"] = get_metrics("month")
 
-        context["all_tasks"] = user_tasks.count()
-        context["all_completed"] = user_tasks.filter(status="done").count()
-        context["all_hours"] = sum(
-            t.estimated_hours or 0 for t in user_tasks.filter(status="done")
-        )
+        context["all_tasks"] = totals["all_total"]
+        context["all_completed"] = totals["all_completed"]
+        context["all_hours"] = totals["all_hours"]
 
-        context["recent_tasks"] = user_tasks.order_by("-created_at")[:5]
+        recent_tasks = []
+        for tasks in task_sources:
+            recent_tasks += tasks.select_related("category").order_by("-created_at")[:5]
+        recent_tasks.sort(key=lambda t: t.created_at, reverse=True)
+        context["recent_tasks"] = recent_tasks[:5]
 
         return context
 
@@ -97,9 +179,7 @@ class ProfileEditView(LoginRequiredMixin, UpdateView):
     template_name = "tasks/profile_edit.html"
 
     def get_object(self):
-        if not hasattr(self.request.user, "profile"):
-            Profile.objects.create(user=self.request.user)
-        return self.request.user.profile
+        return get_object_or_404(Profile, user=self.request.user)
 
     def get_success_url(self):
         return reverse_lazy("profile", kwargs={"username": self.request.user.username})
@@ -112,7 +192,9 @@ class TaskListView(LoginRequiredMixin, ListView):
     paginate_by = 10
 
     def get_queryset(self):
-        queryset = Task.objects.select_related("category", "assigned_to")
+        queryset = with_card_data(
+            Task.objects.select_related("category", "assigned_to")
+        ).order_by("-created_at")
 
         category_id = self.request.GET.get("category")
         if category_id:
@@ -127,26 +209,32 @@ class TaskListView(LoginRequiredMixin, ListView):
             queryset = queryset.filter(priority=priority)
 
         date_filter = self.request.GET.get("date_filter")
-        today = timezone.now().date()
-        if date_filter == "today":
-            queryset = queryset.filter(deadline__date=today)
-        elif date_filter == "week":
-            week_end = today + timedelta(days=7)
-            queryset = queryset.filter(
-                deadline__date__gte=today, deadline__date__lte=week_end
-            )
-        elif date_filter == "overdue":
-            queryset = queryset.filter(deadline__lt=timezone.now()).exclude(
-                status="done"
-            )
+        queryset = queryset.filter(date_filter_q(date_filter))
 
         return queryset
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["categories"] = Category.objects.all()
-        context["statuses"] = Task.STATUS_CHOICES
-        context["priorities"] = Task.PRIORITY_CHOICES
+        filters = {
+            name: self.request.GET.get(name, "")
+            for name in ("category", "status", "priority", "date_filter")
+        }
+        counts = get_facet_counts(filters)
+        context["facet_totals"] = {name: counts[name][""] for name in counts}
+        context["categories"] = [
+            (cat, counts["category"][str(cat.pk)]) for cat in Category.objects.all()
+        ]
+        context["statuses"] = [
+            (code, label, counts["status"][code]) for code, label in Task.STATUS_CHOICES
+        ]
+        context["priorities"] = [
+            (code, label, counts["priority"][code])
+            for code, label in Task.PRIORITY_CHOICES
+        ]
+        context["date_filters"] = [
+            (code, label, counts["date_filter"][code])
+            for code, label in DATE_FILTER_CHOICES
+        ]
         context["current_category"] = self.request.GET.get("category", "")
         context["current_status"] = self.request.GET.get("status", "")
         context["current_priority"] = self.request.GET.get("priority", "")
@@ -159,6 +247,30 @@ class TaskDetailView(LoginRequiredMixin, DetailView):
     template_name = "tasks/task_detail.html"
     context_object_name = "task"
 
+    def get_object(self, queryset=None):
+        return get_task(self.kwargs["pk"])
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["blockers"] = get_blockers(self.object)
+        context["blocked_tasks"] = get_blocked(self.object)
+        return context
+
+
+class TaskSearchView(LoginRequiredMixin, ListView):
+    template_name = "tasks/task_search.html"
+    context_object_name = "tasks"
+    paginate_by = 20
+
+    def get_queryset(self):
+        self.query = self.request.GET.get("q", "").strip()
+        return search_tasks(self.query) if self.query else []
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["query"] = self.query
+        return context
+
 
 class TaskCreateView(LoginRequiredMixin, CreateView):
     model = Task
@@ -185,13 +297,9 @@ class KanbanView(LoginRequiredMixin, TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["statuses"] = Task.STATUS_CHOICES
-        context["tasks_by_status"] = {
-            status[0]: Task.objects.filter(status=status[0]).select_related(
-                "category", "assigned_to"
-            )
-            for status in Task.STATUS_CHOICES
-        }
+        context["columns"] = build_kanban_columns(
+            Task.objects.select_related("category", "assigned_to")
+        )
         return context
 
 